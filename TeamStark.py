@@ -1,17 +1,13 @@
+import operator
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-import joblib
-import os
-import requests
-import tempfile
+
+from model_utils import XGBOOST_AVAILABLE, compile_predictor, load_model
 
 # Check for required dependencies
-try:
-    import xgboost
-    XGBOOST_AVAILABLE = True
-except ImportError:
-    XGBOOST_AVAILABLE = False
+if not XGBOOST_AVAILABLE:
     st.error("""
     **Missing Dependency**: xgboost is not installed.
     
@@ -26,8 +22,54 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Enhanced CSS for styling with cool background
-st.markdown("""
+# Static page content
+_FEATURE_CARD_HTML = """
+    <div class="feature-card">
+    <strong>Key Predictive Factors:</strong>
+    <ul>
+    <li><strong>Age & Gender</strong> - Baseline risk factors</li>
+    <li><strong>Cholesterol Levels</strong> - Lipid profile impact</li>
+    <li><strong>Blood Pressure</strong> - Cardiovascular strain</li>
+    <li><strong>Chest Pain Type</strong> - Symptom patterns</li>
+    <li><strong>Exercise Response</strong> - Functional capacity</li>
+    <li><strong>ST Depression</strong> - Ischemia indicator</li>
+    <li><strong>Major Vessels</strong> - Anatomical assessment</li>
+    </ul>
+    </div>
+    """
+
+_ABOUT_HTML = """
+    <div class="feature-card">
+    **HeartGuard Pro** uses advanced machine learning to assess heart disease risk based on clinical parameters.
+    
+    **Model Characteristics:**
+    - Algorithm: XGBoost with Optuna optimization
+    - Accuracy: ~85% (validation)
+    - Features: 13 clinical parameters
+    - Training: UCI Heart Disease Dataset
+    
+    **Last Updated:** January 2024
+    **Version:** 2.0 with Enhanced Validation
+    </div>
+    """
+
+_EMERGENCY_HTML = """
+    <div style="background-color: rgba(255, 235, 238, 0.9); padding: 1rem; border-radius: 10px; border-left: 4px solid #ff4b4b;">
+    <strong>Seek Immediate Medical Attention for:</strong>
+    <ul>
+    <li>Chest pain or pressure</li>
+    <li>Shortness of breath</li>
+    <li>Radiating arm/jaw pain</li>
+    <li>Sudden dizziness</li>
+    <li>Severe palpitations</li>
+    </ul>
+    <strong>Emergency Contact:</strong> 911 or local emergency services
+    </div>
+    """
+
+# Enhanced CSS for styling with cool background, bundled with the fixed-position
+# footer so both go to the browser as a single element
+TEMPLATE = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -110,104 +152,188 @@ st.markdown("""
         100% { background-position: 0% 50%; }
     }
 </style>
-""", unsafe_allow_html=True)
+
+    <div class="footer">
+        TeamStark ©2025 | TechCrush Project
+    </div>
+    """
+
+st.markdown(TEMPLATE, unsafe_allow_html=True)
+
+# Display labels for coded categorical inputs
+_SEX_LABELS = {0: "Female", 1: "Male"}
+_CP_LABELS = {
+    0: "Typical Angina",
+    1: "Atypical Angina",
+    2: "Non-anginal Pain",
+    3: "Asymptomatic"
+}
+_FBS_LABELS = {0: "Normal", 1: "High (>120 mg/dl)"}
+_RESTECG_LABELS = {
+    0: "Normal",
+    1: "ST-T Wave Abnormality",
+    2: "Left Ventricular Hypertrophy"
+}
+_EXANG_LABELS = {0: "No", 1: "Yes"}
+_SLOPE_LABELS = {
+    0: "Upsloping",
+    1: "Flat",
+    2: "Downsloping"
+}
+_THAL_LABELS = {
+    1: "Normal",
+    2: "Fixed Defect",
+    3: "Reversible Defect"
+}
+
+# Validation thresholds: (cut points, messages) per parameter. Low bands fire when the
+# value is strictly below a cut, high bands when it is strictly above one; None = no warning.
+_AGE_LOW = (np.array([20, 30]), [
+    "Error: Age outside typical adult range (20-100 years)",
+    "Info: Patient is relatively young for heart disease assessment",
+    None,
+])
+_AGE_HIGH = (np.array([70, 100]), [
+    None,
+    "Warning: Advanced age - increased baseline risk",
+    "Error: Age outside typical adult range (20-100 years)",
+])
+_BP_LOW = (np.array([80, 90]), [
+    "Error: Very low resting blood pressure (hypotension)",
+    "Warning: Low resting blood pressure",
+    None,
+])
+_BP_HIGH = (np.array([140, 180]), [
+    None,
+    "Warning: Elevated resting blood pressure (Stage 1 Hypertension)",
+    "Error: Very high resting blood pressure (Hypertensive Crisis)",
+])
+_CHOL_LOW = (np.array([100, 125]), [
+    "Error: Very low cholesterol level",
+    "Warning: Low cholesterol level",
+    None,
+])
+_CHOL_HIGH = (np.array([240, 300]), [
+    None,
+    "Warning: High cholesterol level (Hypercholesterolemia)",
+    "Error: Very high cholesterol level",
+])
+_THALACH_LOW_MSGS = [
+    "Warning: Low maximum heart rate achieved",
+    "Info: Submaximal exercise heart rate",
+    None,
+]
+_THALACH_HIGH_MSGS = [
+    None,
+    "Warning: Maximum heart rate exceeds predicted maximum for age",
+]
+_OLDPEAK_LOW = (np.array([0]), [
+    "Error: ST depression cannot be negative",
+    None,
+])
+_OLDPEAK_HIGH = (np.array([4, 6]), [
+    None,
+    "Warning: Significant ST depression detected",
+    "Error: Very high ST depression - consider immediate medical attention",
+])
+_CA_HIGH = (np.array([3]), [
+    None,
+    "Warning: High number of major vessels affected",
+])
+
+def _range_message(value, low=None, high=None):
+    """Return the message for the band the value falls in, or None if it is in range"""
+    message = None
+    if low is not None:
+        cuts, messages = low
+        message = messages[np.searchsorted(cuts, value, side='right')]
+    if message is None and high is not None:
+        cuts, messages = high
+        message = messages[np.searchsorted(cuts, value, side='left')]
+    return message
 
 # Validation Functions
 def validate_patient_inputs(age, sex, trestbps, chol, thalach, oldpeak, ca, thal):
     """
     Validate patient inputs and return warnings if any values are outside typical ranges
     """
-    warnings = []
-    
-    # Age validation
-    if age < 20 or age > 100:
-        warnings.append("Error: Age outside typical adult range (20-100 years)")
-    elif age < 30:
-        warnings.append("Info: Patient is relatively young for heart disease assessment")
-    elif age > 70:
-        warnings.append("Warning: Advanced age - increased baseline risk")
-    
-    # Blood pressure validation
-    if trestbps < 80:
-        warnings.append("Error: Very low resting blood pressure (hypotension)")
-    elif trestbps < 90:
-        warnings.append("Warning: Low resting blood pressure")
-    elif trestbps > 140:
-        warnings.append("Warning: Elevated resting blood pressure (Stage 1 Hypertension)")
-    elif trestbps > 180:
-        warnings.append("Error: Very high resting blood pressure (Hypertensive Crisis)")
-    
-    # Cholesterol validation
-    if chol < 100:
-        warnings.append("Error: Very low cholesterol level")
-    elif chol < 125:
-        warnings.append("Warning: Low cholesterol level")
-    elif chol > 240:
-        warnings.append("Warning: High cholesterol level (Hypercholesterolemia)")
-    elif chol > 300:
-        warnings.append("Error: Very high cholesterol level")
-    
-    # Maximum heart rate validation
-    max_predicted_hr = 220 - age  # Rough estimate
-    if thalach > max_predicted_hr + 20:
-        warnings.append("Warning: Maximum heart rate exceeds predicted maximum for age")
-    elif thalach < 100:
-        warnings.append("Warning: Low maximum heart rate achieved")
-    elif thalach < (max_predicted_hr * 0.85):
-        warnings.append("Info: Submaximal exercise heart rate")
-    
-    # ST Depression validation
-    if oldpeak < 0:
-        warnings.append("Error: ST depression cannot be negative")
-    elif oldpeak > 4:
-        warnings.append("Warning: Significant ST depression detected")
-    elif oldpeak > 6:
-        warnings.append("Error: Very high ST depression - consider immediate medical attention")
-    
-    # Number of major vessels
-    if ca > 3:
-        warnings.append("Warning: High number of major vessels affected")
-    
-    return warnings
-
-def validate_input_completeness(input_data):
-    """
-    Check if all required fields are filled
-    """
-    missing_fields = []
-    for field, value in input_data.items():
-        if value is None or (isinstance(value, (int, float)) and np.isnan(value)):
-            missing_fields.append(field)
+    # Maximum heart rate bands depend on the age-predicted maximum (rough estimate)
+    max_predicted_hr = 220 - age
+    thalach_low = (np.array([100, max_predicted_hr * 0.85]), _THALACH_LOW_MSGS)
+    thalach_high = (np.array([max_predicted_hr + 20]), _THALACH_HIGH_MSGS)
+    
+    messages = (
+        _range_message(age, _AGE_LOW, _AGE_HIGH),
+        _range_message(trestbps, _BP_LOW, _BP_HIGH),
+        _range_message(chol, _CHOL_LOW, _CHOL_HIGH),
+        _range_message(thalach, thalach_low, thalach_high),
+        _range_message(oldpeak, _OLDPEAK_LOW, _OLDPEAK_HIGH),
+        _range_message(ca, high=_CA_HIGH),
+    )
     
-    return missing_fields
+    return [message for message in messages if message is not None]
+
+# Data quality rules: (field, min, max, points deducted, reason); None = unbounded
+_QUALITY_RULES = (
+    ('age', 20, 100, 20, "Age outside typical range"),
+    ('trestbps', 80, 200, 15, "BP outside typical range"),
+    ('chol', 100, 400, 15, "Cholesterol outside typical range"),
+    ('thalach', 60, None, 10, "Very low max heart rate"),
+    ('oldpeak', None, 6, 10, "Extreme ST depression"),
+)
 
-def calculate_data_quality_score(input_dict):
-    """Calculate a data quality score based on input validity"""
+def validate_and_score(input_dict):
+    """Validate inputs and calculate a data quality score in a single pass"""
+    warnings = validate_patient_inputs(
+        input_dict['age'], input_dict['sex'], input_dict['trestbps'], input_dict['chol'],
+        input_dict['thalach'], input_dict['oldpeak'], input_dict['ca'], input_dict['thal']
+    )
+    
+    # Deduct points for outliers
     score = 100
     deductions = []
+    for field, low, high, points, reason in _QUALITY_RULES:
+        value = input_dict[field]
+        if (low is not None and value < low) or (high is not None and value > high):
+            score -= points
+            deductions.append(reason)
     
-    # Check each parameter and deduct points for outliers
-    if not (20 <= input_dict['age'] <= 100):
-        score -= 20
-        deductions.append("Age outside typical range")
-    
-    if not (80 <= input_dict['trestbps'] <= 200):
-        score -= 15
-        deductions.append("BP outside typical range")
-    
-    if not (100 <= input_dict['chol'] <= 400):
-        score -= 15
-        deductions.append("Cholesterol outside typical range")
-    
-    if input_dict['thalach'] < 60:
-        score -= 10
-        deductions.append("Very low max heart rate")
-    
-    if input_dict['oldpeak'] > 6:
-        score -= 10
-        deductions.append("Extreme ST depression")
-    
-    return max(score, 0), deductions
+    return warnings, max(score, 0), deductions
+
+def get_validation_result(input_dict):
+    """Return (warnings, score, deductions), reusing the session's result while inputs are unchanged"""
+    key = tuple(input_dict[field] for field in FEATURES)
+    if st.session_state.get("_val_key") != key:
+        st.session_state["_val_result"] = validate_and_score(input_dict)
+        st.session_state["_val_key"] = key
+    return st.session_state["_val_result"]
+
+# Risk factor rules: (field, comparison, threshold, label template)
+_MAJOR_RISK_RULES = (
+    ('age', operator.gt, 55, "Age ({age} years)"),
+    ('trestbps', operator.gt, 140, "Hypertension"),
+    ('chol', operator.gt, 240, "High Cholesterol"),
+    ('fbs', operator.eq, 1, "Elevated Blood Sugar"),
+    ('exang', operator.eq, 1, "Exercise-Induced Angina"),
+    ('oldpeak', operator.gt, 2.0, "Significant ST Depression"),
+)
+_CONTRIBUTING_RISK_RULES = (
+    ('cp', operator.ge, 1, "Atypical Chest Pain"),  # types 1-3
+    ('restecg', operator.ge, 1, "ECG Abnormalities"),  # types 1-2
+    ('slope', operator.eq, 2, "Downsloping ST Segment"),
+    ('ca', operator.gt, 0, "{ca} Major Vessel(s) Affected"),
+    ('thal', operator.eq, 3, "Reversible Thalassemia"),
+)
+
+def classify_risk_factors(input_dict):
+    """Return (major factors, contributing factors) present in the patient inputs"""
+    def matching(rules):
+        return [
+            template.format(**input_dict)
+            for field, compare, threshold, template in rules
+            if compare(input_dict[field], threshold)
+        ]
+    return matching(_MAJOR_RISK_RULES), matching(_CONTRIBUTING_RISK_RULES)
 
 def display_vital_status(age, trestbps, chol, thalach, oldpeak):
     """Display color-coded vital status"""
@@ -271,57 +397,31 @@ def show_input_guidelines():
           3 = Reversible Defect
         """)
 
-# Load model with multiple fallback options
-@st.cache_resource
-def load_model():
-    if not XGBOOST_AVAILABLE:
-        st.error("Cannot load model: xgboost is not installed")
-        return None
-        
-    try:
-        # Try local paths first (removed success message)
-        local_paths = [
-            'models/final_xgb_optuna.pkl',
-            './final_xgb_optuna.pkl',
-            'final_xgb_optuna.pkl'
-        ]
-        
-        for path in local_paths:
-            if os.path.exists(path):
-                # Removed the success message that was here
-                return joblib.load(path)
-        
-        # If local not found, download from GitHub
-        st.info("Downloading model from GitHub...")
-        
-        # Raw GitHub URL
-        github_raw_url = "https://raw.githubusercontent.com/Abdulmuj33b/TechCrush_Capstone_TeamStark/main/models/final_xgb_optuna.pkl"
-        
-        # Download the file
-        response = requests.get(github_raw_url, stream=True)
-        response.raise_for_status()
-        
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pkl') as tmp_file:
-            for chunk in response.iter_content(chunk_size=8192):
-                tmp_file.write(chunk)
-            temp_path = tmp_file.name
-        
-        # Load the model from temporary file
-        model = joblib.load(temp_path)
-        
-        # Clean up
-        os.unlink(temp_path)
-        
-        return model
-        
-    except Exception as e:
-        st.error(f"Error loading model: {e}")
-        return None
-
 # Initialize model
 model = load_model()
 
+FEATURES = (
+    'age', 'sex', 'cp', 'trestbps', 'chol', 'fbs',
+    'restecg', 'thalach', 'exang', 'oldpeak', 'slope', 'ca', 'thal'
+)
+
+# Fast path that scores the input row directly on the booster (None = use the pipeline)
+predictor = compile_predictor(model, FEATURES)
+
+@st.cache_data(max_entries=512, ttl="1h")
+def predict_risk(age, sex, cp, trestbps, chol, fbs, restecg, thalach, exang, oldpeak, slope, ca, thal):
+    """Return the probability of heart disease for a single patient (cached per input set)"""
+    # Built per call: sessions run in separate threads, so a shared buffer would race
+    X = np.array([[
+        age, sex, cp, trestbps, chol, fbs, restecg,
+        thalach, exang, oldpeak, slope, ca, thal
+    ]], dtype=np.float64)
+    if predictor is not None:
+        return float(predictor(X)[0])
+    # The pipeline's ColumnTransformer selects features by name
+    input_data = pd.DataFrame(X, columns=FEATURES, copy=False)
+    return float(model.predict_proba(input_data)[0, 1])
+
 # Main app content with enhanced background
 st.markdown('<div class="content-container">', unsafe_allow_html=True)
 
@@ -334,116 +434,111 @@ with st.sidebar:
     st.header("Patient Information")
     st.markdown("---")
     
-    # Personal Information
-    st.subheader("Personal Details")
-    age = st.slider("Age", 20, 100, 50, help="Patient's age in years")
-    sex = st.radio("Sex", options=[0, 1], format_func=lambda x: "Female" if x == 0 else "Male")
+    # All inputs live in one form so the app reruns once per submission,
+    # not once per widget change
+    with st.form("patient_form"):
+        # Personal Information
+        st.subheader("Personal Details")
+        age = st.slider("Age", 20, 100, 50, help="Patient's age in years")
+        sex = st.radio("Sex", options=[0, 1], format_func=_SEX_LABELS.__getitem__)
     
-    st.markdown("---")
+        st.markdown("---")
     
-    # Medical History
-    st.subheader("Medical Examination")
+        # Medical History
+        st.subheader("Medical Examination")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        cp = st.selectbox(
-            "Chest Pain Type", 
-            options=[0, 1, 2, 3],
-            format_func=lambda x: {
-                0: "Typical Angina",
-                1: "Atypical Angina", 
-                2: "Non-anginal Pain",
-                3: "Asymptomatic"
-            }[x]
-        )
+        with col1:
+            cp = st.selectbox(
+                "Chest Pain Type", 
+                options=[0, 1, 2, 3],
+                format_func=_CP_LABELS.__getitem__
+            )
         
-        trestbps = st.number_input(
-            "Resting BP (mm Hg)", 
-            min_value=80, max_value=200, value=120,
-            help="Resting blood pressure"
-        )
+            trestbps = st.number_input(
+                "Resting BP (mm Hg)", 
+                min_value=80, max_value=200, value=120,
+                help="Resting blood pressure"
+            )
         
-        chol = st.number_input(
-            "Cholesterol (mg/dl)",
-            min_value=100, max_value=600, value=200,
-            help="Serum cholesterol level"
-        )
+            chol = st.number_input(
+                "Cholesterol (mg/dl)",
+                min_value=100, max_value=600, value=200,
+                help="Serum cholesterol level"
+            )
         
-        fbs = st.selectbox(
-            "Fasting Blood Sugar", 
-            options=[0, 1],
-            format_func=lambda x: "Normal" if x == 0 else "High (>120 mg/dl)"
-        )
-    
-    with col2:
-        restecg = st.selectbox(
-            "Resting ECG", 
-            options=[0, 1, 2],
-            format_func=lambda x: {
-                0: "Normal",
-                1: "ST-T Wave Abnormality",
-                2: "Left Ventricular Hypertrophy"
-            }[x]
-        )
+            fbs = st.selectbox(
+                "Fasting Blood Sugar", 
+                options=[0, 1],
+                format_func=_FBS_LABELS.__getitem__
+            )
+    
+        with col2:
+            restecg = st.selectbox(
+                "Resting ECG", 
+                options=[0, 1, 2],
+                format_func=_RESTECG_LABELS.__getitem__
+            )
         
-        thalach = st.slider(
-            "Max Heart Rate", 
-            min_value=60, max_value=220, value=150,
-            help="Maximum heart rate achieved"
-        )
+            thalach = st.slider(
+                "Max Heart Rate", 
+                min_value=60, max_value=220, value=150,
+                help="Maximum heart rate achieved"
+            )
         
-        exang = st.selectbox(
-            "Exercise Angina", 
-            options=[0, 1],
-            format_func=lambda x: "No" if x == 0 else "Yes"
-        )
+            exang = st.selectbox(
+                "Exercise Angina", 
+                options=[0, 1],
+                format_func=_EXANG_LABELS.__getitem__
+            )
     
-    st.markdown("---")
+        st.markdown("---")
     
-    # Exercise Test Results
-    st.subheader("Exercise Test")
+        # Exercise Test Results
+        st.subheader("Exercise Test")
     
-    oldpeak = st.slider(
-        "ST Depression", 
-        min_value=0.0, max_value=6.0, value=1.0, step=0.1,
-        help="ST depression induced by exercise relative to rest"
-    )
+        oldpeak = st.slider(
+            "ST Depression", 
+            min_value=0.0, max_value=6.0, value=1.0, step=0.1,
+            help="ST depression induced by exercise relative to rest"
+        )
     
-    slope = st.selectbox(
-        "ST Slope", 
-        options=[0, 1, 2],
-        format_func=lambda x: {
-            0: "Upsloping",
-            1: "Flat", 
-            2: "Downsloping"
-        }[x]
-    )
+        slope = st.selectbox(
+            "ST Slope", 
+            options=[0, 1, 2],
+            format_func=_SLOPE_LABELS.__getitem__
+        )
     
-    ca = st.selectbox(
-        "Major Vessels", 
-        options=[0, 1, 2, 3, 4],
-        help="Number of major vessels colored by fluoroscopy"
-    )
+        ca = st.selectbox(
+            "Major Vessels", 
+            options=[0, 1, 2, 3, 4],
+            help="Number of major vessels colored by fluoroscopy"
+        )
     
-    thal = st.selectbox(
-        "Thalassemia", 
-        options=[1, 2, 3],
-        format_func=lambda x: {
-            1: "Normal",
-            2: "Fixed Defect", 
-            3: "Reversible Defect"
-        }[x]
-    )
+        thal = st.selectbox(
+            "Thalassemia", 
+            options=[1, 2, 3],
+            format_func=_THAL_LABELS.__getitem__
+        )
+    
+        submitted = st.form_submit_button(
+            "Calculate Heart Disease Risk", type="primary", use_container_width=True
+        )
 
-    # Real-time validation
+    # Validation of the submitted inputs
     st.markdown("---")
     st.subheader("Input Validation")
     
-    # Run validation
-    validation_warnings = validate_patient_inputs(
-        age, sex, trestbps, chol, thalach, oldpeak, ca, thal
-    )
+    # Create input data dictionary
+    input_dict = {
+        'age': age, 'sex': sex, 'cp': cp, 'trestbps': trestbps,
+        'chol': chol, 'fbs': fbs, 'restecg': restecg, 'thalach': thalach,
+        'exang': exang, 'oldpeak': oldpeak, 'slope': slope, 'ca': ca, 'thal': thal
+    }
+    
+    # Run validation (reused by the risk calculation below)
+    validation_warnings, data_quality_score, quality_issues = get_validation_result(input_dict)
     
     # Display validation results
     if validation_warnings:
@@ -469,27 +564,10 @@ col1, col2 = st.columns([2, 1])
 with col1:
     st.header("Risk Assessment")
     
-    # Create input data dictionary
-    input_dict = {
-        'age': age, 'sex': sex, 'cp': cp, 'trestbps': trestbps,
-        'chol': chol, 'fbs': fbs, 'restecg': restecg, 'thalach': thalach,
-        'exang': exang, 'oldpeak': oldpeak, 'slope': slope, 'ca': ca, 'thal': thal
-    }
-    
-    if st.button("Calculate Heart Disease Risk", type="primary", use_container_width=True):
+    if submitted:
         if model is None:
             st.error("Model not available. Please check if the model file is properly installed.")
         else:
-            # Check for missing fields
-            missing_fields = validate_input_completeness(input_dict)
-            
-            if missing_fields:
-                st.error(f"Missing required fields: {', '.join(missing_fields)}")
-                st.stop()
-            
-            # Calculate data quality score
-            data_quality_score, quality_issues = calculate_data_quality_score(input_dict)
-            
             # Show validation summary
             if validation_warnings or quality_issues:
                 st.subheader("Validation Summary")
@@ -503,20 +581,10 @@ with col1:
                 
                 st.markdown("---")
             
-            # Create DataFrame for prediction
-            input_data = pd.DataFrame([[
-                age, sex, cp, trestbps, chol, fbs, restecg, 
-                thalach, exang, oldpeak, slope, ca, thal
-            ]], columns=[
-                'age', 'sex', 'cp', 'trestbps', 'chol', 'fbs', 
-                'restecg', 'thalach', 'exang', 'oldpeak', 'slope', 'ca', 'thal'
-            ])
-            
             # Make prediction
             with st.spinner("Analyzing patient data..."):
                 try:
-                    prediction_proba = model.predict_proba(input_data)[:, 1]
-                    probability_of_disease = prediction_proba[0] * 100
+                    probability_of_disease = predict_risk(**input_dict) * 100
                     
                     # Display results
                     st.subheader("Prediction Result")
@@ -550,49 +618,21 @@ with col1:
                     st.subheader("Risk Factor Analysis")
                     risk_col1, risk_col2 = st.columns(2)
                     
+                    major_factors, contributing_factors = classify_risk_factors(input_dict)
+                    
                     with risk_col1:
                         st.write("**Major Risk Factors:**")
-                        major_factors = []
-                        
-                        if age > 55:
-                            major_factors.append(f"Age ({age} years)")
-                        if trestbps > 140:
-                            major_factors.append("Hypertension")
-                        if chol > 240:
-                            major_factors.append("High Cholesterol")
-                        if fbs == 1:
-                            major_factors.append("Elevated Blood Sugar")
-                        if exang == 1:
-                            major_factors.append("Exercise-Induced Angina")
-                        if oldpeak > 2.0:
-                            major_factors.append("Significant ST Depression")
-                        
-                        for factor in major_factors:
-                            st.write(f"• {factor}")
-                        
-                        if not major_factors:
-                            st.write("No major risk factors identified")
+                        st.markdown(
+                            "\n".join(f"- {factor}" for factor in major_factors)
+                            or "No major risk factors identified"
+                        )
                     
                     with risk_col2:
                         st.write("**Contributing Factors:**")
-                        contributing_factors = []
-                        
-                        if cp in [1, 2, 3]:
-                            contributing_factors.append("Atypical Chest Pain")
-                        if restecg in [1, 2]:
-                            contributing_factors.append("ECG Abnormalities")
-                        if slope == 2:
-                            contributing_factors.append("Downsloping ST Segment")
-                        if ca > 0:
-                            contributing_factors.append(f"{ca} Major Vessel(s) Affected")
-                        if thal == 3:
-                            contributing_factors.append("Reversible Thalassemia")
-                        
-                        for factor in contributing_factors:
-                            st.write(f"• {factor}")
-                        
-                        if not contributing_factors:
-                            st.write("No additional contributing factors")
+                        st.markdown(
+                            "\n".join(f"- {factor}" for factor in contributing_factors)
+                            or "No additional contributing factors"
+                        )
                     
                     # Clinical recommendations based on risk level
                     st.subheader("Clinical Recommendations")
@@ -637,65 +677,17 @@ with col1:
 
 with col2:
     st.header("Feature Importance")
-    st.markdown("""
-    <div class="feature-card">
-    <strong>Key Predictive Factors:</strong>
-    <ul>
-    <li><strong>Age & Gender</strong> - Baseline risk factors</li>
-    <li><strong>Cholesterol Levels</strong> - Lipid profile impact</li>
-    <li><strong>Blood Pressure</strong> - Cardiovascular strain</li>
-    <li><strong>Chest Pain Type</strong> - Symptom patterns</li>
-    <li><strong>Exercise Response</strong> - Functional capacity</li>
-    <li><strong>ST Depression</strong> - Ischemia indicator</li>
-    <li><strong>Major Vessels</strong> - Anatomical assessment</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FEATURE_CARD_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
     st.header("About This Tool")
-    st.markdown("""
-    <div class="feature-card">
-    **HeartGuard Pro** uses advanced machine learning to assess heart disease risk based on clinical parameters.
-    
-    **Model Characteristics:**
-    - Algorithm: XGBoost with Optuna optimization
-    - Accuracy: ~85% (validation)
-    - Features: 13 clinical parameters
-    - Training: UCI Heart Disease Dataset
-    
-    **Last Updated:** January 2024
-    **Version:** 2.0 with Enhanced Validation
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_ABOUT_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
     st.header("Emergency Info")
-    st.markdown("""
-    <div style="background-color: rgba(255, 235, 238, 0.9); padding: 1rem; border-radius: 10px; border-left: 4px solid #ff4b4b;">
-    <strong>Seek Immediate Medical Attention for:</strong>
-    <ul>
-    <li>Chest pain or pressure</li>
-    <li>Shortness of breath</li>
-    <li>Radiating arm/jaw pain</li>
-    <li>Sudden dizziness</li>
-    <li>Severe palpitations</li>
-    </ul>
-    <strong>Emergency Contact:</strong> 911 or local emergency services
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_EMERGENCY_HTML, unsafe_allow_html=True)
 
 # Close content container
 st.markdown('</div>', unsafe_allow_html=True)
-
-# Footer
-st.markdown(
-    """
-    <div class="footer">
-        TeamStark ©2025 | TechCrush Project
-    </div>
-    """, 
-    unsafe_allow_html=True
-)
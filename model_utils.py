@@ -0,0 +1,158 @@
+"""Model loading shared by the HeartGuard Streamlit app"""
+
+import os
+
+import numpy as np
+import streamlit as st
+
+# Single-row inference never amortizes OpenMP worker start-up. This only reaches
+# the OpenMP runtime xgboost loads on its first import (numpy's BLAS is already
+# initialized under `streamlit run`); _single_thread pins nthread regardless
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+# Check for required dependencies
+try:
+    import xgboost
+    XGBOOST_AVAILABLE = True
+except ImportError:
+    XGBOOST_AVAILABLE = False
+
+# Persistent download location so restarts don't re-fetch the model
+MODEL_CACHE_PATH = os.path.expanduser("~/.cache/heartguard/final_xgb_optuna.pkl")
+
+def _single_thread(model):
+    """Run the XGBoost step on one thread; the app only ever predicts one row at a time"""
+    clf = getattr(model, 'named_steps', {}).get('clf', model)
+    try:
+        clf.set_params(n_jobs=1)
+    except Exception:
+        pass
+    try:
+        clf.get_booster().set_param({'nthread': 1})
+    except Exception:
+        pass
+    return model
+
+def _load_pickle(path):
+    """Unpickle the model pipeline and prepare it for single-row inference"""
+    import joblib
+    return _single_thread(joblib.load(path))
+
+# Load model with multiple fallback options
+@st.cache_resource
+def load_model():
+    if not XGBOOST_AVAILABLE:
+        st.error("Cannot load model: xgboost is not installed")
+        return None
+        
+    try:
+        # Try local paths first (removed success message)
+        local_paths = [
+            'models/final_xgb_optuna.pkl',
+            './final_xgb_optuna.pkl',
+            'final_xgb_optuna.pkl',
+            MODEL_CACHE_PATH
+        ]
+        
+        for path in local_paths:
+            if os.path.exists(path):
+                # Removed the success message that was here
+                return _load_pickle(path)
+        
+        # If local not found, download from GitHub
+        st.info("Downloading model from GitHub...")
+        
+        # Only needed on a cache miss, so kept out of the local-path fast path
+        import requests
+        import shutil
+        import tempfile
+        
+        # Raw GitHub URL
+        github_raw_url = "https://raw.githubusercontent.com/Abdulmuj33b/TechCrush_Capstone_TeamStark/main/models/final_xgb_optuna.pkl"
+        
+        # Write to a temporary file next to the cache path, then move it into place
+        # so an interrupted download never leaves a truncated model behind
+        cache_dir = os.path.dirname(MODEL_CACHE_PATH)
+        os.makedirs(cache_dir, exist_ok=True)
+        
+        # Download the file in 1 MiB chunks straight from the raw stream
+        with requests.get(github_raw_url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False, suffix='.pkl') as tmp_file:
+                try:
+                    # Pre-size the file when the decoded length is known to avoid fragmentation
+                    content_length = int(response.headers.get('Content-Length', 0))
+                    encoded = response.headers.get('Content-Encoding', 'identity') != 'identity'
+                    if content_length and not encoded and hasattr(os, 'posix_fallocate'):
+                        os.posix_fallocate(tmp_file.fileno(), 0, content_length)
+                    shutil.copyfileobj(response.raw, tmp_file, length=1024 * 1024)
+                    # A short read would otherwise leave a zero-padded file of the expected size
+                    if content_length and not encoded and tmp_file.tell() != content_length:
+                        raise IOError(
+                            f"Incomplete model download: got {tmp_file.tell()} of {content_length} bytes"
+                        )
+                except BaseException:
+                    tmp_file.close()
+                    os.unlink(tmp_file.name)
+                    raise
+        
+        # Only cache the file once it is known to unpickle, so a bad download is retried
+        try:
+            model = _load_pickle(tmp_file.name)
+        except BaseException:
+            os.unlink(tmp_file.name)
+            raise
+        os.replace(tmp_file.name, MODEL_CACHE_PATH)
+        
+        return model
+        
+    except Exception as e:
+        st.error(f"Error loading model: {e}")
+        return None
+
+def compile_predictor(model, features):
+    """
+    Specialize the fitted pipeline for the app's fixed-shape input.
+    
+    The preprocessing step is a median imputer plus a standard scaler over the raw
+    features, so it is folded into constant arrays and rows are scored straight on
+    the XGBoost booster, skipping the ColumnTransformer/Pipeline dispatch. Returns a
+    function mapping a (n, len(features)) float array to the probability of heart
+    disease, or None when the pipeline doesn't have that shape or the classifier
+    isn't a binary:logistic model.
+    """
+    try:
+        pre = model.named_steps['pre']
+        clf = model.named_steps['clf']
+        if getattr(clf, 'objective', None) != 'binary:logistic':
+            return None
+        booster = clf.get_booster()
+        # Match predict_proba, which stops at the early-stopping best iteration
+        try:
+            iteration_range = (0, clf.best_iteration + 1)
+        except AttributeError:
+            iteration_range = (0, 0)
+        num_steps = None
+        for name, transformer, columns in pre.transformers_:
+            if name == 'num':
+                if list(columns) != list(features):
+                    return None
+                num_steps = transformer.named_steps
+            elif len(columns) and transformer != 'drop':
+                return None
+        if num_steps is None or list(num_steps) != ['imputer', 'scaler']:
+            return None
+        
+        fill = np.asarray(num_steps['imputer'].statistics_, dtype=np.float64)
+        scaler = num_steps['scaler']
+        mean = scaler.mean_ if scaler.with_mean else 0.0
+        scale = scaler.scale_ if scaler.with_std else 1.0
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+    
+    def predict(X):
+        X = np.where(np.isnan(X), fill, X)
+        return booster.inplace_predict((X - mean) / scale, iteration_range=iteration_range)
+    
+    return predict